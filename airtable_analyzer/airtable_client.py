@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
-from collections import deque
-from typing import Any, Deque, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
 
-import requests
-from requests import Response, Session
+import httpx
+import orjson
+from httpx import Response
 
 from .exceptions import (
     AirtableAuthenticationError,
@@ -16,13 +20,13 @@ from .exceptions import (
     AirtableNotFoundError,
     AirtableRateLimitError,
 )
-from .models import AirtableBaseSchema, AirtableTable, AirtableView
+from .models import AirtableBaseSchema
 
 LOGGER = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Simple thread-safe rate limiter implementing a leaky bucket algorithm."""
+    """Thread-safe rate limiter implementing a token bucket algorithm."""
 
     def __init__(self, max_calls: int, period_seconds: float) -> None:
         """Initialize the rate limiter.
@@ -33,31 +37,60 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.period_seconds = period_seconds
-        self._timestamps: Deque[float] = deque()
+        self.capacity = float(max_calls)
+        self.rate = max_calls / period_seconds
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
 
     def acquire(self) -> None:
         """Block until another request is permitted."""
-        while True:
-            now = time.monotonic()
-            while self._timestamps and now - self._timestamps[0] > self.period_seconds:
-                self._timestamps.popleft()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.last_refill
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.last_refill = now
 
-            if len(self._timestamps) < self.max_calls:
-                self._timestamps.append(now)
-                return
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
 
-            sleep_duration = self.period_seconds - (now - self._timestamps[0])
-            if sleep_duration <= 0:
-                # The loop will clean up on the next iteration.
-                continue
+                self._cond.wait(timeout=(1.0 - self.tokens) / self.rate)
 
-            time.sleep(sleep_duration)
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so no caller proceeds for roughly ``seconds``.
+
+        Args:
+            seconds: Delay requested by the server before the next request.
+        """
+        with self._cond:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+            self.tokens = min(self.tokens, 1.0 - seconds * self.rate)
 
 
 class AirtableClient:
     """Client responsible for retrieving Airtable metadata."""
 
     API_ROOT = "https://api.airtable.com/v0"
+    MAX_VIEW_WORKERS = 8
+    MAX_CONNECTIONS = 32
+    MAX_KEEPALIVE_CONNECTIONS = 16
+    _STATUS_HANDLERS: Dict[int, str] = {
+        429: "rate_limit",
+        500: "server",
+        502: "server",
+        503: "server",
+        504: "server",
+        401: "auth",
+        403: "auth",
+        404: "not_found",
+    }
+    MAX_BACKOFF_SECONDS = 60.0
 
     def __init__(
         self,
@@ -65,26 +98,44 @@ class AirtableClient:
         timeout_seconds: int,
         max_retries: int,
         initial_backoff_seconds: float,
-        session: Optional[Session] = None,
+        session: Optional[httpx.Client] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         """Initialize the client with authentication and retry configuration."""
-        self.session = session or requests.Session()
+        self.session = session or self._build_session()
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json",
             }
         )
+        # Schema payloads compress well; keep any richer encoding list already set.
+        self.session.headers.setdefault("Accept-Encoding", "gzip, deflate")
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.initial_backoff_seconds = initial_backoff_seconds
         self.rate_limiter = RateLimiter(max_calls=5, period_seconds=1.0)
         self.logger = logger or LOGGER
+        self._schema_cache: Dict[str, AirtableBaseSchema] = {}
+
+    def _build_session(self) -> httpx.Client:
+        """Create an HTTP/2 client whose pool covers every view worker."""
+        # HTTP/2 multiplexes the concurrent view requests over shared connections.
+        # Retries stay in ``_request``; the client only handles connection reuse.
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
 
     def fetch_base_schema(self, base_id: str) -> AirtableBaseSchema:
         """Retrieve the full base schema including tables and views.
 
+        Schemas are cached per base ID for the lifetime of the client; call
+        ``clear_cache`` to force a fresh download.
+
         Args:
             base_id: Airtable base identifier.
 
@@ -94,33 +145,47 @@ class AirtableClient:
         Raises:
             AirtableClientError: For unrecoverable Airtable API failures.
         """
+        cached = self._schema_cache.get(base_id)
+        if cached is not None:
+            return cached
+
         base_info = self._fetch_base_information(base_id)
         raw_tables = self._fetch_tables(base_id)
-        tables: List[AirtableTable] = []
-
-        for raw_table in raw_tables:
-            table_id = raw_table["id"]
-            try:
-                raw_views = self._fetch_views(base_id, table_id)
-            except AirtableNotFoundError:
-                raw_views = []
-
-            table = AirtableTable.model_validate(
-                {
-                    **raw_table,
-                    "views": [AirtableView.model_validate(view) for view in raw_views],
-                }
-            )
-            tables.append(table)
+        tables = raw_tables
+        # The tables endpoint normally inlines views; only fall back to the
+        # per-table views endpoint for tables that arrive without them.
+        if any(raw_table.get("views") is None for raw_table in raw_tables):
+            # View requests are network-bound; overlap them while the shared rate
+            # limiter keeps the overall request budget in check.
+            with ThreadPoolExecutor(max_workers=self.MAX_VIEW_WORKERS) as executor:
+                tables = list(
+                    executor.map(partial(self._build_table, base_id), raw_tables)
+                )
 
         base_name = base_info.get("name") or base_info.get("id") or base_id
 
-        return AirtableBaseSchema.model_validate(
+        # Validate the whole tree in a single pydantic-core pass.
+        schema = AirtableBaseSchema.model_validate(
             {"id": base_info.get("id", base_id), "name": base_name, "tables": tables}
         )
+        self._schema_cache[base_id] = schema
+        return schema
+
+    def clear_cache(self) -> None:
+        """Discard schemas cached by previous ``fetch_base_schema`` calls."""
+        self._schema_cache.clear()
+
+    def _build_table(self, base_id: str, raw_table: Dict[str, Any]) -> Dict[str, Any]:
+        if raw_table.get("views") is not None:
+            return raw_table
+        try:
+            raw_views = self._fetch_views(base_id, raw_table["id"])
+        except AirtableNotFoundError:
+            raw_views = []
+        return {**raw_table, "views": raw_views}
 
     def _fetch_base_information(self, base_id: str) -> Dict[str, Any]:
-        response = self._request("GET", f"/meta/bases/{base_id}")
+        response = self._request(f"/meta/bases/{base_id}")
         body = self._parse_json(response)
         if "base" in body:
             return body["base"]
@@ -141,42 +206,37 @@ class AirtableClient:
     ) -> List[Dict[str, Any]]:
         items: List[Dict[str, Any]] = []
         offset: Optional[str] = None
+        base_params = params or {}
 
         while True:
-            query = dict(params or {})
-            if offset:
-                query["offset"] = offset
+            query = {**base_params, "offset": offset} if offset else base_params
 
-            response = self._request("GET", path, params=query)
+            response = self._request(path, params=query)
             payload = self._parse_json(response)
-            batch = payload.get(collection_key, [])
-            if not isinstance(batch, list):
-                raise AirtableClientError(
-                    f"Unexpected response format: '{collection_key}' is not a list."
-                )
-            items.extend(batch)
+            batch = payload.get(collection_key)
+            if batch is not None:
+                if not isinstance(batch, list):
+                    raise AirtableClientError(
+                        f"Unexpected response format: '{collection_key}' is not a list."
+                    )
+                items.extend(batch)
             offset = payload.get("offset")
             if not offset:
                 break
 
         return items
 
-    def _request(
-        self, method: str, path: str, *, params: Optional[Dict[str, Any]] = None
-    ) -> Response:
+    def _request(self, path: str, *, params: Optional[Dict[str, Any]] = None) -> Response:
         url = f"{self.API_ROOT}{path}"
         attempt = 0
 
         while True:
             self.rate_limiter.acquire()
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    timeout=self.timeout_seconds,
+                response = self.session.get(
+                    url, params=params, timeout=self.timeout_seconds
                 )
-            except requests.Timeout as exc:
+            except httpx.TimeoutException as exc:
                 self._log_debug("Request timeout encountered.", attempt, exc)
                 if attempt >= self.max_retries:
                     raise AirtableClientError("Airtable API request timed out.") from exc
@@ -184,52 +244,76 @@ class AirtableClient:
                 attempt += 1
                 continue
 
-            if response.status_code == 429:
+            status_code = response.status_code
+            if status_code < 400:
+                return response
+
+            handler = self._STATUS_HANDLERS.get(status_code, "client_error")
+            if handler == "rate_limit":
                 self._log_debug("Rate limit response received.", attempt, None)
                 if attempt >= self.max_retries:
                     raise AirtableRateLimitError(
                         "Exceeded Airtable rate limit despite retries."
                     )
-                self._sleep_backoff(attempt)
+                # Throttling applies to every worker, so the shared limiter absorbs
+                # the delay and all callers wait in acquire() instead of this thread.
+                self.rate_limiter.penalize(self._retry_delay(response, attempt))
                 attempt += 1
                 continue
 
-            if response.status_code in {500, 502, 503, 504}:
+            if handler == "server":
                 self._log_debug("Server error received.", attempt, None)
                 if attempt >= self.max_retries:
-                    raise AirtableClientError(
-                        f"Airtable server error ({response.status_code})."
-                    )
-                self._sleep_backoff(attempt)
+                    raise AirtableClientError(f"Airtable server error ({status_code}).")
+                self._sleep_backoff(attempt, response)
                 attempt += 1
                 continue
 
-            if response.status_code in {401, 403}:
+            if handler == "auth":
                 raise AirtableAuthenticationError(
                     "Airtable authentication failed. Verify access token and scopes."
                 )
 
-            if response.status_code == 404:
+            if handler == "not_found":
                 raise AirtableNotFoundError(
                     "Airtable resource not found. Verify the base identifier."
                 )
 
-            if response.status_code >= 400:
-                raise AirtableClientError(
-                    f"Airtable API error ({response.status_code}): {response.text}"
-                )
-
-            return response
+            raise AirtableClientError(
+                f"Airtable API error ({status_code}): {response.text}"
+            )
 
     def _parse_json(self, response: Response) -> Dict[str, Any]:
         try:
-            return response.json()
-        except ValueError as exc:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             raise AirtableClientError("Failed to parse Airtable response as JSON.") from exc
 
-    def _sleep_backoff(self, attempt: int) -> None:
-        backoff = self.initial_backoff_seconds * (2 ** attempt)
-        time.sleep(backoff)
+    def _sleep_backoff(self, attempt: int, response: Optional[Response] = None) -> None:
+        time.sleep(self._retry_delay(response, attempt))
+
+    def _retry_delay(self, response: Optional[Response], attempt: int) -> float:
+        retry_after = None if response is None else self._parse_retry_after(response)
+        if retry_after is not None:
+            # Honor the server hint; jitter only spreads workers out past it.
+            jitter = random.uniform(0, self.initial_backoff_seconds)
+            return min(self.MAX_BACKOFF_SECONDS, retry_after + jitter)
+
+        # Full jitter keeps concurrent workers from retrying in lockstep.
+        backoff = min(
+            self.MAX_BACKOFF_SECONDS, self.initial_backoff_seconds * (2 ** attempt)
+        )
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def _parse_retry_after(response: Response) -> Optional[float]:
+        header = response.headers.get("Retry-After")
+        if not header:
+            return None
+        try:
+            return max(float(header), 0.0)
+        except ValueError:
+            return None
 
     def _log_debug(
         self, message: str, attempt: int, exception: Optional[Exception]
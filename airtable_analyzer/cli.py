@@ -92,6 +92,8 @@ def _resolve_settings(
     if model:
         overrides["gemini_model"] = model
     if overrides:
+        # model_copy is a shallow copy of the cached instance; it does not reload
+        # the environment or the .env file.
         return settings.model_copy(update=overrides)
     return settings
 
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Dict, Optional
 
 import google.generativeai as genai
+import orjson
 from google.generativeai import types as genai_types
 
 from .exceptions import GeminiClientError
@@ -14,6 +14,77 @@ from .models import DuplicationGuide, SchemaAnalysis
 
 LOGGER = logging.getLogger(__name__)
 
+_GUIDE_SCHEMA: Dict[str, Any] = {
+    "base_overview": "string",
+    "key_considerations": ["string"],
+    "table_details": [
+        {
+            "table_name": "string",
+            "summary": "string",
+            "field_instructions": ["string"],
+            "view_instructions": ["string"],
+            "sequencing_notes": ["string"],
+        }
+    ],
+    "relationships": ["string"],
+    "duplication_steps": [
+        {
+            "order": "integer",
+            "title": "string",
+            "description": "string",
+            "prerequisites": ["string"],
+        }
+    ],
+    "post_duplication_checks": ["string"],
+}
+_GUIDE_SCHEMA_JSON = orjson.dumps(_GUIDE_SCHEMA, option=orjson.OPT_INDENT_2).decode()
+_PROMPT_PREFIX = (
+    "You are an Airtable expert helping engineers recreate complex bases.\n"
+    "Analyze the provided base schema and produce a structured JSON object "
+    "that strictly matches the following schema:\n"
+    f"{_GUIDE_SCHEMA_JSON}\n\n"
+    "Guidance:\n"
+    "- Provide a concise overview emphasizing critical configuration areas.\n"
+    "- Include detailed table instructions covering fields, formulas, lookups, "
+    "rollups, select options, and formatting requirements.\n"
+    "- Outline relationships and dependencies so tables can be created in the "
+    "correct order.\n"
+    "- Supply a sequential duplication plan using the base's dependencies.\n"
+    "- End with validation steps to confirm parity with the original base.\n\n"
+    "Schema payload:\n"
+)
+
+# Serialized in pydantic-core instead of rebuilding each dict attribute by attribute.
+_FIELD_PROMPT_FIELDS = {
+    "id",
+    "name",
+    "type",
+    "is_primary",
+    "description",
+    "configuration",
+    "linked_table_id",
+    "linked_table_name",
+}
+_VIEW_PROMPT_FIELDS = {
+    "id",
+    "name",
+    "type",
+    "description",
+    "visible_fields",
+    "filters",
+    "sorts",
+    "groups",
+}
+_TABLE_PROMPT_FIELDS: Dict[str, Any] = {
+    "id": True,
+    "name": True,
+    "description": True,
+    "primary_field_id": True,
+    "dependencies": True,
+    "fields": {"__all__": _FIELD_PROMPT_FIELDS},
+    "views": {"__all__": _VIEW_PROMPT_FIELDS},
+}
+
 
 class GeminiClient:
     """Client responsible for interacting with Gemini 2.5."""
@@ -76,39 +147,7 @@ class GeminiClient:
                 "name": analysis.base_name,
                 "suggested_table_creation_order": analysis.suggested_table_creation_order,
                 "tables": [
-                    {
-                        "id": table.id,
-                        "name": table.name,
-                        "description": table.description,
-                        "primary_field_id": table.primary_field_id,
-                        "dependencies": table.dependencies,
-                        "fields": [
-                            {
-                                "id": field.id,
-                                "name": field.name,
-                                "type": field.type,
-                                "is_primary": field.is_primary,
-                                "description": field.description,
-                                "configuration": field.configuration,
-                                "linked_table_id": field.linked_table_id,
-                                "linked_table_name": field.linked_table_name,
-                            }
-                            for field in table.fields
-                        ],
-                        "views": [
-                            {
-                                "id": view.id,
-                                "name": view.name,
-                                "type": view.type,
-                                "description": view.description,
-                                "visible_fields": view.visible_fields,
-                                "filters": view.filters,
-                                "sorts": view.sorts,
-                                "groups": view.groups,
-                            }
-                            for view in table.views
-                        ],
-                    }
+                    table.model_dump(include=_TABLE_PROMPT_FIELDS)
                     for table in analysis.tables
                 ],
                 "relationships": [
@@ -125,55 +164,26 @@ class GeminiClient:
         }
 
     def _format_prompt(self, payload: Dict[str, Any]) -> str:
-        guide_schema = {
-            "base_overview": "string",
-            "key_considerations": ["string"],
-            "table_details": [
-                {
-                    "table_name": "string",
-                    "summary": "string",
-                    "field_instructions": ["string"],
-                    "view_instructions": ["string"],
-                    "sequencing_notes": ["string"],
-                }
-            ],
-            "relationships": ["string"],
-            "duplication_steps": [
-                {
-                    "order": "integer",
-                    "title": "string",
-                    "description": "string",
-                    "prerequisites": ["string"],
-                }
-            ],
-            "post_duplication_checks": ["string"],
-        }
-        prompt = (
-            "You are an Airtable expert helping engineers recreate complex bases.\n"
-            "Analyze the provided base schema and produce a structured JSON object "
-            "that strictly matches the following schema:\n"
-            f"{json.dumps(guide_schema, indent=2)}\n\n"
-            "Guidance:\n"
-            "- Provide a concise overview emphasizing critical configuration areas.\n"
-            "- Include detailed table instructions covering fields, formulas, lookups, "
-            "rollups, select options, and formatting requirements.\n"
-            "- Outline relationships and dependencies so tables can be created in the "
-            "correct order.\n"
-            "- Supply a sequential duplication plan using the base's dependencies.\n"
-            "- End with validation steps to confirm parity with the original base.\n\n"
-            "Schema payload:\n"
-            f"{json.dumps(payload, indent=2)}\n\n"
-            "Output only the JSON object."
-        )
-        return prompt
+        payload_json = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return f"{_PROMPT_PREFIX}{payload_json}\n\nOutput only the JSON object."
 
     def _extract_text(self, response: Any) -> str:
         content = getattr(response, "text", None)
         if isinstance(content, str):
             return content
 
+        candidate_list = getattr(response, "candidates", None) or []
+        if candidate_list:
+            # JSON mode normally yields one part; return it without re-joining.
+            first_content = getattr(candidate_list[0], "content", None)
+            first_parts = getattr(first_content, "parts", None) or []
+            if len(first_parts) == 1:
+                text = getattr(first_parts[0], "text", None)
+                if isinstance(text, str):
+                    return text
+
         candidates: list[str] = []
-        for candidate in getattr(response, "candidates", []):
+        for candidate in candidate_list:
             content_obj = getattr(candidate, "content", None)
             parts = getattr(content_obj, "parts", []) if content_obj else []
             for part in parts:
@@ -187,7 +197,7 @@ class GeminiClient:
 
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
         try:
-            return json.loads(response_text)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive
             self.logger.error("Gemini returned invalid JSON: %s", response_text)
             raise GeminiClientError("Gemini response was not valid JSON.") from exc
@@ -3,12 +3,17 @@
 
 from __future__ import annotations
 
-import json
+import io
 import logging
 import re
 from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import orjson
 
 from .exceptions import ReportGenerationError
 from .models import (
@@ -25,27 +30,8 @@ from .models import (
 
 LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
-class ReportMetrics:
-    """Calculated metrics used to enrich the report."""
-
-    table_count: int
-    field_count: int
-    relationship_count: int
-    formula_count: int
-    lookup_count: int
-    rollup_count: int
-    linked_count: int
-    single_select_count: int
-    relationship_counter: Counter
-    dependencies_by_target: Dict[str, List[str]]
-
-
-class ReportBuilder:
-    """Build a human-readable markdown duplication guide."""
-
-    SIMPLE_FIELD_TYPES = {
+_SIMPLE_FIELD_TYPES = frozenset(
+    {
         "singleLineText",
         "multilineText",
         "email",
@@ -60,7 +46,9 @@ class ReportBuilder:
         "duration",
         "rating",
     }
-    COMPLEX_FIELD_TYPES = {
+)
+_COMPLEX_FIELD_TYPES = frozenset(
+    {
         "formula",
         "lookup",
         "rollup",
@@ -70,17 +58,23 @@ class ReportBuilder:
         "singleSelect",
         "multipleSelects",
     }
-    RELATIONSHIP_FIELD_TYPES = {
+)
+_RELATIONSHIP_FIELD_TYPES = frozenset(
+    {
         "multipleRecordLinks",
         "singleRecordLink",
         "linkedRecord",
     }
-    ASSIGNMENT_FIELD_TYPES = {
+)
+_ASSIGNMENT_FIELD_TYPES = frozenset(
+    {
         "user",
         "collaborator",
         "multipleCollaborators",
     }
-    METADATA_FIELD_TYPES = {
+)
+_METADATA_FIELD_TYPES = frozenset(
+    {
         "createdTime",
         "lastModifiedTime",
         "createdBy",
@@ -90,25 +84,150 @@ class ReportBuilder:
         "rollup",
         "lookup",
     }
-    STATUS_FIELD_TYPES = {
+)
+_STATUS_FIELD_TYPES = frozenset(
+    {
         "singleSelect",
         "multipleSelects",
         "checkbox",
     }
-    RATING_FIELD_TYPES = {"rating"}
+)
+_RATING_FIELD_TYPES = frozenset({"rating"})
+_STATUS_KEYWORDS = ("status", "stage", "state", "phase", "progress")
+_ASSIGNMENT_KEYWORDS = ("assign", "owner", "lead", "manager", "responsible")
+_METADATA_KEYWORDS = (
+    "created",
+    "updated",
+    "modified",
+    "timestamp",
+    "notes",
+    "description",
+    "comment",
+)
+_STATUS_RE = re.compile("|".join(map(re.escape, _STATUS_KEYWORDS)))
+_ASSIGNMENT_RE = re.compile("|".join(map(re.escape, _ASSIGNMENT_KEYWORDS)))
+_METADATA_RE = re.compile("|".join(map(re.escape, _METADATA_KEYWORDS)))
+_FIELD_REF_RE = re.compile(r"\{([^}]+)\}")
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_TASK_SPLIT_RE = re.compile(r"[.;]")
+_EDGE_TARGET_KEY = itemgetter(0)
+_COUNT_KEY = itemgetter(1)
+_EDGE_PAIR_KEY = itemgetter(0, 1)
+_STEP_ORDER_KEY = attrgetter("order")
+_TABLE_NAME_ATTR = attrgetter("table_name")
+_CORE_FIELD_TYPES = frozenset({"singleLineText", "multilineText"})
+_CALCULATED_FIELD_TYPES = frozenset({"formula", "lookup", "rollup"})
+_SELECT_FIELD_TYPES = frozenset({"singleSelect", "multipleSelects"})
+_NUMERIC_FIELD_TYPES = frozenset({"number", "currency", "percent"})
+_DATE_FIELD_TYPES = frozenset({"date", "dateTime"})
+_NUMBER_TYPES = (int, float)
+_FORMULA_DESCRIPTORS = (
+    (frozenset({"IF(", "SWITCH("}), "Evaluates conditions to choose outputs"),
+    (frozenset({"SUM(", "AVERAGE(", "COUNT(", "MIN(", "MAX("}), "Aggregates numeric values"),
+    (frozenset({"DATETIME", "DATE", "NOW(", "TODAY("}), "Works with dates or times"),
+    (frozenset({"FIND(", "SEARCH(", "REGEX"}), "Checks text content"),
+)
+_FORMULA_KEYWORD_BITS = {
+    keyword: 1 << index
+    for index, (keywords, _) in enumerate(_FORMULA_DESCRIPTORS)
+    for keyword in keywords
+}
+_FORMULA_COMBINES_BIT = 1 << len(_FORMULA_DESCRIPTORS)
+# Longest keywords first so the alternation prefers DATETIME over DATE.
+_FORMULA_TOKEN_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in sorted(_FORMULA_KEYWORD_BITS, key=len, reverse=True)
+    )
+)
+
+
+def _formula_description(mask: int) -> str:
+    descriptors = [
+        descriptor
+        for index, (_, descriptor) in enumerate(_FORMULA_DESCRIPTORS)
+        if mask & (1 << index)
+    ]
+    if mask & _FORMULA_COMBINES_BIT:
+        descriptors.append("Combines multiple fields")
+    if not descriptors:
+        return "Derives a calculated value from the referenced fields"
+    return "; ".join(descriptors)
+
+
+# Every combination of formula traits, indexed by its bitmask.
+_FORMULA_DESCRIPTIONS = tuple(
+    _formula_description(mask) for mask in range(_FORMULA_COMBINES_BIT << 1)
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorize(field_type: str, name_lower: str, is_primary: bool, has_link: bool) -> str:
+    """Return the report group for a field; pure, so it is memoized."""
+    if is_primary or field_type in _CORE_FIELD_TYPES:
+        return "Core Fields"
+    if field_type in _RELATIONSHIP_FIELD_TYPES or has_link:
+        return "Relationship Fields"
+    if field_type in _ASSIGNMENT_FIELD_TYPES or _ASSIGNMENT_RE.search(name_lower):
+        return "Assignment Fields"
+    if field_type in _STATUS_FIELD_TYPES or _STATUS_RE.search(name_lower):
+        return "Status Management"
+    if field_type in _RATING_FIELD_TYPES or "rating" in name_lower:
+        return "Rating Fields"
+    if field_type in _CALCULATED_FIELD_TYPES:
+        return "Calculated Fields"
+    if field_type in _METADATA_FIELD_TYPES or _METADATA_RE.search(name_lower):
+        return "Metadata Fields"
+    return "Other Fields"
+
+
+def _write_bullets(buf: io.StringIO, items: Iterable[str], prefix: str = "- ") -> None:
+    buf.writelines(f"{prefix}{item}\n" for item in items)
+
+
+@lru_cache(maxsize=128)
+def _humanize_relationship_type(rel_type: str) -> str:
+    return rel_type.replace("_", " ").lower()
+
+
+@lru_cache(maxsize=128)
+def _humanize_field_type(field_type: str) -> str:
+    spaced = _CAMEL_BOUNDARY_RE.sub(" ", field_type)
+    return spaced.replace("_", " ").lower()
+
+
+@dataclass
+class ReportMetrics:
+    """Calculated metrics used to enrich the report."""
+
+    table_count: int
+    field_count: int
+    relationship_count: int
+    formula_count: int
+    lookup_count: int
+    rollup_count: int
+    linked_count: int
+    single_select_count: int
+    relationship_type_counts: Dict[str, int]
+    dependencies_by_target: Dict[str, Tuple[str, ...]]
+
+
+class ReportBuilder:
+    """Build a human-readable markdown duplication guide."""
+
+    SIMPLE_FIELD_TYPES = _SIMPLE_FIELD_TYPES
+    COMPLEX_FIELD_TYPES = _COMPLEX_FIELD_TYPES
+    RELATIONSHIP_FIELD_TYPES = _RELATIONSHIP_FIELD_TYPES
+    ASSIGNMENT_FIELD_TYPES = _ASSIGNMENT_FIELD_TYPES
+    METADATA_FIELD_TYPES = _METADATA_FIELD_TYPES
+    STATUS_FIELD_TYPES = _STATUS_FIELD_TYPES
+    RATING_FIELD_TYPES = _RATING_FIELD_TYPES
     COLLAPSIBLE_THRESHOLD = 12
+    MAX_VISIBLE_FIELDS = 12
 
-    STATUS_KEYWORDS = ("status", "stage", "state", "phase", "progress")
-    ASSIGNMENT_KEYWORDS = ("assign", "owner", "lead", "manager", "responsible")
-    METADATA_KEYWORDS = (
-        "created",
-        "updated",
-        "modified",
-        "timestamp",
-        "notes",
-        "description",
-        "comment",
-    )
+    STATUS_KEYWORDS = _STATUS_KEYWORDS
+    ASSIGNMENT_KEYWORDS = _ASSIGNMENT_KEYWORDS
+    METADATA_KEYWORDS = _METADATA_KEYWORDS
 
     def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         """Create a report builder."""
@@ -126,85 +245,75 @@ class ReportBuilder:
             field_lookup = self._build_field_lookup(analysis)
             metrics = self._compute_metrics(analysis)
 
-            lines: List[str] = []
-            lines.append(f"# Airtable Base Duplication Guide: {schema.name}")
-            lines.append("")
+            buf = io.StringIO()
+            write = buf.write
+            write(f"# Airtable Base Duplication Guide: {schema.name}\n")
+            write("\n")
 
-            lines.extend(
-                self._format_quick_reference(
-                    analysis=analysis,
-                    metrics=metrics,
-                    creation_order=analysis.suggested_table_creation_order,
-                )
+            self._format_quick_reference(
+                buf,
+                analysis=analysis,
+                metrics=metrics,
+                creation_order=analysis.suggested_table_creation_order,
             )
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            write("\n---\n\n")
 
-            lines.append("## Base Overview")
-            lines.append("")
-            lines.append(guide.base_overview.strip())
-            lines.append("")
+            write("## Base Overview\n\n")
+            write(f"{guide.base_overview.strip()}\n")
+            write("\n")
 
             if guide.key_considerations:
-                lines.append("### Key Considerations")
-                lines.extend([f"- {item}" for item in guide.key_considerations])
-                lines.append("")
-
-            lines.append("---")
-            lines.append("")
-            lines.extend(
-                self._format_relationship_section(
-                    analysis=analysis,
-                    guide=guide,
-                )
+                write("### Key Considerations\n")
+                _write_bullets(buf, guide.key_considerations)
+                write("\n")
+
+            write("---\n\n")
+            self._format_relationship_section(
+                buf,
+                analysis=analysis,
+                guide=guide,
             )
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            write("\n---\n\n")
 
-            table_detail_lookup = {
-                detail.table_name: detail for detail in guide.table_details
-            }
+            table_details = guide.table_details
+            table_detail_lookup: Dict[str, DuplicationTableDetail] = (
+                dict(zip(map(_TABLE_NAME_ATTR, table_details), table_details))
+                if table_details
+                else {}
+            )
 
-            lines.append("## Table Breakdown")
-            lines.append("")
+            write("## Table Breakdown\n\n")
             for table in analysis.tables:
-                lines.extend(
-                    self._format_table_section(
-                        table=table,
-                        table_detail_lookup=table_detail_lookup,
-                        table_lookup=table_lookup,
-                        field_lookup=field_lookup,
-                        metrics=metrics,
-                    )
+                self._format_table_section(
+                    buf, table, table_detail_lookup, table_lookup, field_lookup, metrics
                 )
-                lines.append("")
+                write("\n")
 
             if guide.duplication_steps:
-                lines.append("---")
-                lines.append("")
-                lines.extend(self._format_duplication_steps(guide.duplication_steps))
+                write("---\n\n")
+                self._format_duplication_steps(buf, guide.duplication_steps)
 
             if guide.post_duplication_checks:
-                lines.append("")
-                lines.append("## Post-duplication Validation")
-                lines.extend([f"- {item}" for item in guide.post_duplication_checks])
+                write("\n## Post-duplication Validation\n")
+                _write_bullets(buf, guide.post_duplication_checks)
 
-            return "\n".join(lines).strip()
+            return buf.getvalue().strip()
         except Exception as exc:  # noqa: BLE001
             raise ReportGenerationError("Failed to build markdown report.") from exc
 
     def _format_quick_reference(
         self,
+        buf: io.StringIO,
         analysis: SchemaAnalysis,
         metrics: ReportMetrics,
         creation_order: Sequence[str],
-    ) -> List[str]:
-        lines = ["## Quick Reference", ""]
+    ) -> None:
+        buf.write("## Quick Reference\n\n")
         relationships_by_type = ", ".join(
             f"{self._humanize_relationship_type(rel_type)} x {count}"
-            for rel_type, count in metrics.relationship_counter.most_common()
+            for rel_type, count in sorted(
+                metrics.relationship_type_counts.items(), key=_COUNT_KEY, reverse=True
+            )
         )
 
         calculated_summary = (
@@ -212,324 +321,298 @@ class ReportBuilder:
             f"{metrics.rollup_count} rollups"
         )
 
-        lines.append(
+        buf.write(
             "- **Structure:** "
             f"{metrics.table_count} tables · {metrics.field_count} fields · "
-            f"{metrics.relationship_count} relationships"
+            f"{metrics.relationship_count} relationships\n"
         )
-        lines.append(f"- **Calculated fields:** {calculated_summary}")
+        buf.write(f"- **Calculated fields:** {calculated_summary}\n")
         if relationships_by_type:
-            lines.append(f"- **Relationships by type:** {relationships_by_type}")
+            buf.write(f"- **Relationships by type:** {relationships_by_type}\n")
 
         if creation_order:
-            lines.append("")
-            lines.append("**Table creation sequence**")
+            buf.write("\n**Table creation sequence**\n")
             for index, table_name in enumerate(creation_order, start=1):
-                lines.append(f"{index}. {table_name}")
+                buf.write(f"{index}. {table_name}\n")
 
         if not metrics.relationship_count:
-            lines.append("")
-            lines.append("_No cross-table relationships detected._")
+            buf.write("\n_No cross-table relationships detected._\n")
 
         has_views = any(table.views for table in analysis.tables)
         if not has_views:
-            lines.append("")
-            lines.append(
-                "_View configurations were not returned by the API; capture key views manually._"
+            buf.write(
+                "\n_View configurations were not returned by the API; "
+                "capture key views manually._\n"
             )
 
-        return lines
     def _format_relationship_section(
         self,
+        buf: io.StringIO,
         analysis: SchemaAnalysis,
         guide: DuplicationGuide,
-    ) -> List[str]:
-        lines: List[str] = ["## Relationships & Flow", ""]
-        diagram_lines = self._build_relationship_diagram_lines(analysis.relationships)
-        if diagram_lines:
-            lines.append("```")
-            lines.extend(diagram_lines)
-            lines.append("```")
+    ) -> None:
+        buf.write("## Relationships & Flow\n\n")
+        diagram_blocks = self._build_relationship_diagram_blocks(analysis.relationships)
+        if diagram_blocks:
+            buf.write("```\n")
+            buf.write("\n\n".join(diagram_blocks))
+            buf.write("\n```\n")
         else:
-            lines.append("_No relationships to visualize._")
+            buf.write("_No relationships to visualize._\n")
 
         key_relationships = self._build_key_relationship_summaries(analysis.relationships)
         if key_relationships:
-            lines.append("")
-            lines.append("**Key relationships**")
-            lines.extend([f"- {item}" for item in key_relationships])
+            buf.write("\n**Key relationships**\n")
+            _write_bullets(buf, key_relationships)
 
         if guide.relationships:
-            lines.append("")
-            lines.append("**LLM insights**")
-            lines.extend([f"- {item}" for item in guide.relationships])
-
-        return lines
+            buf.write("\n**LLM insights**\n")
+            _write_bullets(buf, guide.relationships)
 
     def _format_table_section(
         self,
+        buf: io.StringIO,
         table: TableSummary,
         table_detail_lookup: Dict[str, DuplicationTableDetail],
         table_lookup: Dict[str, str],
         field_lookup: Dict[str, Tuple[str, str]],
         metrics: ReportMetrics,
-    ) -> List[str]:
-        lines: List[str] = [f"### {table.name}"]
+    ) -> None:
+        buf.write(f"### {table.name}\n")
         if table.description:
-            lines.append(table.description)
+            buf.write(f"{table.description}\n")
 
-        detail = table_detail_lookup.get(table.name)
+        detail = table_detail_lookup.get(table.name) if table_detail_lookup else None
         if detail:
-            lines.append(detail.summary)
+            buf.write(f"{detail.summary}\n")
 
         dependency_names = [table_lookup.get(dep, dep) for dep in table.dependencies]
         dependency_names = [name for name in dependency_names if name]
         if dependency_names:
-            lines.append(f"- Depends on: {', '.join(dependency_names)}")
+            buf.write(f"- Depends on: {', '.join(dependency_names)}\n")
 
-        dependents = metrics.dependencies_by_target.get(table.name, [])
+        dependents = metrics.dependencies_by_target.get(table.name)
         if dependents:
-            unique_dependents = sorted(set(dependents))
-            lines.append(f"- Supports: {', '.join(unique_dependents)}")
+            buf.write(f"- Supports: {', '.join(dependents)}\n")
 
         if detail and detail.sequencing_notes:
-            lines.append("- Sequencing notes:")
-            lines.extend([f"  - {note}" for note in detail.sequencing_notes])
-
-        lines.append("")
-        lines.extend(
-            self._format_fields_section(
-                table=table,
-                table_lookup=table_lookup,
-                field_lookup=field_lookup,
-            )
-        )
+            buf.write("- Sequencing notes:\n")
+            _write_bullets(buf, detail.sequencing_notes, prefix="  - ")
+
+        buf.write("\n")
+        self._format_fields_section(buf, table, table_lookup, field_lookup)
 
         if detail and detail.field_instructions:
-            lines.append("")
-            lines.append("#### Gemini Guidance")
-            lines.extend([f"- {instruction}" for instruction in detail.field_instructions])
+            buf.write("\n#### Gemini Guidance\n")
+            _write_bullets(buf, detail.field_instructions)
 
-        view_lines = self._format_table_views(table.views)
-        if view_lines:
-            lines.append("")
-            lines.extend(view_lines)
+        if table.views:
+            buf.write("\n")
+            self._format_table_views(buf, table.views)
 
         if detail and detail.view_instructions:
-            if view_lines:
-                lines.append("")
-                lines.append("**Gemini view notes**")
+            if table.views:
+                buf.write("\n**Gemini view notes**\n")
             else:
-                lines.append("")
-                lines.append("#### View Notes")
-            lines.extend([f"- {instruction}" for instruction in detail.view_instructions])
+                buf.write("\n#### View Notes\n")
+            _write_bullets(buf, detail.view_instructions)
 
-        return lines
     def _format_fields_section(
         self,
+        buf: io.StringIO,
         table: TableSummary,
         table_lookup: Dict[str, str],
         field_lookup: Dict[str, Tuple[str, str]],
-    ) -> List[str]:
+    ) -> None:
         fields = table.fields
         field_groups = self._group_fields(fields)
         field_count = len(fields)
 
-        lines: List[str] = ["#### Fields"]
-        content: List[str] = []
+        buf.write("#### Fields\n")
+        if not any(field_groups.values()):
+            return
+
+        collapsible = field_count > self.COLLAPSIBLE_THRESHOLD
+        if collapsible:
+            buf.write(
+                "<details>\n<summary><strong>Field groups "
+                f"({field_count} fields)</strong></summary>\n"
+            )
+            buf.write("\n")
+
+        first = True
         for group_name, group_fields in field_groups.items():
             if not group_fields:
                 continue
-            content.append(f"**{group_name}**")
+            if not first:
+                buf.write("\n")
+            first = False
+            buf.write(f"**{group_name}**\n")
             for field in group_fields:
-                content.extend(
-                    self._format_field_entry(
-                        field=field,
-                        table_lookup=table_lookup,
-                        field_lookup=field_lookup,
-                    )
-                )
-            content.append("")
+                self._format_field_entry(buf, field, table_lookup, field_lookup)
 
-        while content and not content[-1]:
-            content.pop()
-
-        if field_count > self.COLLAPSIBLE_THRESHOLD and content:
-            lines.append(
-                "<details>\n<summary><strong>Field groups "
-                f"({field_count} fields)</strong></summary>"
-            )
-            lines.append("")
-            lines.extend(content)
-            lines.append("</details>")
-        else:
-            lines.extend(content)
-
-        return lines
+        if collapsible:
+            buf.write("</details>\n")
 
     def _format_field_entry(
         self,
+        buf: io.StringIO,
         field: FieldSummary,
         table_lookup: Dict[str, str],
         field_lookup: Dict[str, Tuple[str, str]],
-    ) -> List[str]:
+    ) -> None:
         display_type = self._humanize_field_type(field.type)
         inline_highlights = self._inline_configuration_highlights(field)
-        inline_suffix = f" | {', '.join(inline_highlights)}" if inline_highlights else ""
-        header = f"- `{field.name}` ({display_type}){inline_suffix}"
-        lines = [header]
+        buf.write(f"- `{field.name}` ({display_type})")
+        if inline_highlights:
+            buf.write(" | ")
+            buf.write(", ".join(inline_highlights))
+        buf.write("\n")
 
         if field.description:
-            lines.append(f"  - {field.description}")
+            buf.write(f"  - {field.description}\n")
 
         if field.linked_table_name:
-            lines.append(f"  - Links to `{field.linked_table_name}`")
-
-        lines.extend(
-            self._format_field_specific_details(
-                field=field,
-                table_lookup=table_lookup,
-                field_lookup=field_lookup,
-            )
-        )
+            buf.write(f"  - Links to `{field.linked_table_name}`\n")
 
-        return lines
+        self._format_field_specific_details(buf, field, table_lookup, field_lookup)
 
     def _format_field_specific_details(
         self,
+        buf: io.StringIO,
         field: FieldSummary,
         table_lookup: Dict[str, str],
         field_lookup: Dict[str, Tuple[str, str]],
-    ) -> List[str]:
+    ) -> None:
         config = field.configuration or {}
         field_type = field.type
-        lines: List[str] = []
+        start = buf.tell()
 
-        if field_type in {"singleSelect", "multipleSelects"}:
+        if field_type in _SELECT_FIELD_TYPES:
             options = self._extract_select_options(config)
             if options:
-                lines.append(f"  - Options: {', '.join(options)}")
-
-        if field_type in self.RELATIONSHIP_FIELD_TYPES:
+                buf.write(f"  - Options: {', '.join(options)}\n")
+        elif field_type in _RELATIONSHIP_FIELD_TYPES:
             relationship_details = self._describe_linked_record(field, config)
             if relationship_details:
-                lines.append(f"  - {relationship_details}")
-
-        if field_type == "lookup":
+                buf.write(f"  - {relationship_details}\n")
+        elif field_type == "lookup":
             lookup_details = self._describe_lookup(field, config, field_lookup, table_lookup)
             if lookup_details:
-                lines.append(f"  - {lookup_details}")
-
-        if field_type == "rollup":
+                buf.write(f"  - {lookup_details}\n")
+        elif field_type == "rollup":
             rollup_details = self._describe_rollup(field, config, field_lookup, table_lookup)
             if rollup_details:
-                lines.append(f"  - {rollup_details}")
-
-        if field_type == "formula":
-            lines.extend(self._format_formula_details(config))
-
-        if field_type not in self.COMPLEX_FIELD_TYPES:
-            inline_notes = self._render_simple_configuration_notes(config)
-            lines.extend([f"  - {note}" for note in inline_notes])
-
-        if not lines and config:
-            serialized = json.dumps(config, indent=2, ensure_ascii=False)
-            lines.append("  - Configuration:")
-            lines.append("    ```json")
-            for config_line in serialized.splitlines():
-                lines.append(f"    {config_line}")
-            lines.append("    ```")
-
-        return lines
-
-    def _format_formula_details(self, config: Dict[str, object]) -> List[str]:
-        lines: List[str] = []
+                buf.write(f"  - {rollup_details}\n")
+        elif field_type == "formula":
+            self._format_formula_details(buf, config)
+        else:
+            # Every complex field type is handled by one of the branches above.
+            notes = self._render_simple_configuration_notes(config)
+            _write_bullets(buf, notes, prefix="  - ")
+
+        if buf.tell() == start and config:
+            serialized = orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+            buf.write("  - Configuration:\n")
+            buf.write("    ```json\n    ")
+            buf.write(serialized.replace("\n", "\n    "))
+            buf.write("\n    ```\n")
+
+    def _format_formula_details(self, buf: io.StringIO, config: Dict[str, object]) -> None:
         formula = config.get("formula")
         if isinstance(formula, str) and formula.strip():
-            lines.append("  - Formula:")
-            lines.append("    ```text")
-            for formula_line in formula.strip().splitlines():
-                lines.append(f"    {formula_line}")
-            lines.append("    ```")
+            buf.write("  - Formula:\n")
+            buf.write("    ```text\n")
+            formula_lines = formula.strip().splitlines()
+            buf.writelines(f"    {line}\n" for line in formula_lines)
+            buf.write("    ```\n")
             description = self._describe_formula(formula)
             if description:
-                lines.append(f"  - Purpose: {description}")
+                buf.write(f"  - Purpose: {description}\n")
             referenced_fields = self._extract_referenced_fields(formula)
             if referenced_fields:
                 field_list = ", ".join(f"`{name}`" for name in referenced_fields)
-                lines.append(f"  - Uses: {field_list}")
-        return lines
+                buf.write(f"  - Uses: {field_list}\n")
 
     def _format_table_views(
         self,
+        buf: io.StringIO,
         views: Sequence[ViewSummary],
-    ) -> List[str]:
+    ) -> None:
         if not views:
-            return []
+            return
 
-        lines: List[str] = ["#### Views"]
+        write = buf.write
+        write("#### Views\n")
         for view in views:
-            summary = f"- `{view.name}` ({view.type or 'custom'})"
-            lines.append(summary)
-            if view.description:
-                lines.append(f"  - {view.description}")
-            if view.visible_fields:
-                fields_display = ", ".join(f"`{field}`" for field in view.visible_fields[:12])
-                if len(view.visible_fields) > 12:
-                    fields_display += ", ..."
-                lines.append(f"  - Visible fields: {fields_display}")
-            if view.sorts:
-                sort_summary = self._format_view_sort(view.sorts)
+            write(f"- `{view.name}` ({view.type or 'custom'})\n")
+            description = view.description
+            if description:
+                write(f"  - {description}\n")
+            visible_fields = view.visible_fields
+            if visible_fields:
+                write("  - Visible fields: ")
+                write(
+                    ", ".join(
+                        f"`{field}`"
+                        for field in islice(visible_fields, self.MAX_VISIBLE_FIELDS)
+                    )
+                )
+                if len(visible_fields) > self.MAX_VISIBLE_FIELDS:
+                    write(", ...")
+                write("\n")
+            sorts = view.sorts
+            if sorts:
+                sort_summary = self._format_view_sort(sorts)
                 if sort_summary:
-                    lines.append(f"  - Sort: {sort_summary}")
-            if view.filters:
-                filter_summary = self._summarize_filter(view.filters)
-                lines.append(f"  - Filters: {filter_summary}")
-            if view.groups:
+                    write(f"  - Sort: {sort_summary}\n")
+            filters = view.filters
+            if filters:
+                write(f"  - Filters: {self._summarize_filter(filters)}\n")
+            groups = view.groups
+            if groups:
                 group_fields = ", ".join(
                     f"`{group.get('fieldId', 'field')}`"
-                    for group in view.groups
+                    for group in groups
                     if isinstance(group, dict)
                 )
                 if group_fields:
-                    lines.append(f"  - Grouped by: {group_fields}")
+                    write(f"  - Grouped by: {group_fields}\n")
 
-        return lines
-    def _format_duplication_steps(self, steps: Sequence[DuplicationStep]) -> List[str]:
-        lines: List[str] = ["## Duplication Steps", ""]
-        ordered_steps = sorted(steps, key=lambda step: step.order)
+    def _format_duplication_steps(
+        self, buf: io.StringIO, steps: Sequence[DuplicationStep]
+    ) -> None:
+        buf.write("## Duplication Steps\n\n")
+        ordered_steps = sorted(steps, key=_STEP_ORDER_KEY)
         total_steps = len(ordered_steps)
 
         for index, step in enumerate(ordered_steps, start=1):
-            lines.extend(self._format_duplication_step(step, total_steps, index))
+            self._format_duplication_step(buf, step, total_steps, index)
             if index < total_steps:
-                lines.append("")
-
-        return lines
+                buf.write("\n")
 
     def _format_duplication_step(
         self,
+        buf: io.StringIO,
         step: DuplicationStep,
         total_steps: int,
         sequence_index: int,
-    ) -> List[str]:
-        lines: List[str] = [f"### Step {step.order}: {step.title}", ""]
+    ) -> None:
+        buf.write(f"### Step {step.order}: {step.title}\n\n")
 
         tasks = self._extract_tasks(step.description)
         if tasks:
-            lines.append("Tasks:")
-            lines.extend([f"- [ ] {task}" for task in tasks])
-            lines.append("")
+            buf.write("Tasks:\n")
+            _write_bullets(buf, tasks, prefix="- [ ] ")
+            buf.write("\n")
 
         if step.description:
-            lines.append(step.description.strip())
-            lines.append("")
+            buf.write(f"{step.description.strip()}\n")
+            buf.write("\n")
 
         if step.prerequisites:
-            lines.append("**Prerequisites**")
-            lines.extend([f"- {item}" for item in step.prerequisites])
-
-        return lines
+            buf.write("**Prerequisites**\n")
+            _write_bullets(buf, step.prerequisites)
 
     def _build_field_lookup(self, analysis: SchemaAnalysis) -> Dict[str, Tuple[str, str]]:
         lookup: Dict[str, Tuple[str, str]] = {}
@@ -543,80 +626,65 @@ class ReportBuilder:
         analysis: SchemaAnalysis,
     ) -> ReportMetrics:
         table_count = len(analysis.tables)
-        field_count = sum(len(table.fields) for table in analysis.tables)
-
-        formula_count = 0
-        lookup_count = 0
-        rollup_count = 0
-        linked_count = 0
-        single_select_count = 0
-
-        for table in analysis.tables:
-            for field in table.fields:
-                field_type = field.type
-                if field_type == "formula":
-                    formula_count += 1
-                elif field_type == "lookup":
-                    lookup_count += 1
-                elif field_type == "rollup":
-                    rollup_count += 1
-                if field_type in self.RELATIONSHIP_FIELD_TYPES:
-                    linked_count += 1
-                if field_type == "singleSelect":
-                    single_select_count += 1
+        type_counts = Counter(
+            field.type for table in analysis.tables for field in table.fields
+        )
+        field_count = sum(type_counts.values())
+        linked_count = sum(type_counts[field_type] for field_type in _RELATIONSHIP_FIELD_TYPES)
 
         relationships = analysis.relationships
-        relationship_counter = Counter(rel.relationship_type for rel in relationships)
         relationship_count = len(relationships)
-
-        dependencies_by_target: Dict[str, List[str]] = defaultdict(list)
+        rel_type_counts: Dict[str, int] = {}
+        dependencies_by_target: Dict[str, Set[str]] = defaultdict(set)
         for rel in relationships:
-            dependencies_by_target[rel.to_table_name].append(rel.from_table_name)
+            rel_type = rel.relationship_type
+            rel_type_counts[rel_type] = rel_type_counts.get(rel_type, 0) + 1
+            dependencies_by_target[rel.to_table_name].add(rel.from_table_name)
 
         return ReportMetrics(
             table_count=table_count,
             field_count=field_count,
             relationship_count=relationship_count,
-            formula_count=formula_count,
-            lookup_count=lookup_count,
-            rollup_count=rollup_count,
+            formula_count=type_counts["formula"],
+            lookup_count=type_counts["lookup"],
+            rollup_count=type_counts["rollup"],
             linked_count=linked_count,
-            single_select_count=single_select_count,
-            relationship_counter=relationship_counter,
-            dependencies_by_target=dependencies_by_target,
+            single_select_count=type_counts["singleSelect"],
+            relationship_type_counts=rel_type_counts,
+            dependencies_by_target={
+                target: tuple(sorted(sources))
+                for target, sources in dependencies_by_target.items()
+            },
         )
 
-    def _build_relationship_diagram_lines(
+    def _build_relationship_diagram_blocks(
         self, relationships: Sequence[RelationshipSummary]
     ) -> List[str]:
         if not relationships:
             return []
 
         adjacency: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
-        all_tables = set()
+        target_tables = set()
         for rel in relationships:
             adjacency[rel.from_table_name].append(
                 (rel.to_table_name, self._humanize_relationship_type(rel.relationship_type))
             )
-            all_tables.add(rel.from_table_name)
-            all_tables.add(rel.to_table_name)
+            target_tables.add(rel.to_table_name)
 
-        diagram_lines: List[str] = []
-        for table_name in sorted(all_tables):
-            diagram_lines.append(f"[{table_name}]")
-            edges = sorted(adjacency.get(table_name, []), key=lambda item: item[0])
+        diagram_blocks: List[str] = []
+        for table_name in sorted(target_tables.union(adjacency)):
+            edges = adjacency.get(table_name)
             if edges:
+                edges.sort(key=_EDGE_TARGET_KEY)
+                block_lines = [f"[{table_name}]"]
                 for idx, (target, rel_type) in enumerate(edges):
                     prefix = "  |--" if idx < len(edges) - 1 else "  '--"
-                    diagram_lines.append(f"{prefix}({rel_type})--> [{target}]")
+                    block_lines.append(f"{prefix}({rel_type})--> [{target}]")
+                diagram_blocks.append("\n".join(block_lines))
             else:
-                diagram_lines.append("  '-- no outgoing links")
-            diagram_lines.append("")
-
-        while diagram_lines and not diagram_lines[-1]:
-            diagram_lines.pop()
+                diagram_blocks.append(f"[{table_name}]\n  '-- no outgoing links")
 
-        return diagram_lines
+        return diagram_blocks
 
     def _build_key_relationship_summaries(
         self, relationships: Sequence[RelationshipSummary]
@@ -624,18 +692,22 @@ class ReportBuilder:
         if not relationships:
             return []
 
-        summary_map: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
-        for rel in relationships:
-            summary_map[(rel.from_table_name, rel.to_table_name)][
-                self._humanize_relationship_type(rel.relationship_type)
-            ] += 1
+        humanize = self._humanize_relationship_type
+        edges = sorted(
+            (
+                rel.from_table_name,
+                rel.to_table_name,
+                humanize(rel.relationship_type),
+            )
+            for rel in relationships
+        )
 
         items: List[str] = []
-        for (source, target), counter in sorted(summary_map.items()):
-            type_segments = [
-                f"{rel_type} x {count}" if count > 1 else rel_type
-                for rel_type, count in sorted(counter.items())
-            ]
+        for (source, target), pair_edges in groupby(edges, key=_EDGE_PAIR_KEY):
+            type_segments = []
+            for rel_type, same_type in groupby(edge[2] for edge in pair_edges):
+                count = sum(1 for _ in same_type)
+                type_segments.append(f"{rel_type} x {count}" if count > 1 else rel_type)
             items.append(f"{source} -> {target} ({', '.join(type_segments)})")
 
         return items
@@ -661,30 +733,12 @@ class ReportBuilder:
         return OrderedDict((name, items) for name, items in grouped.items() if items)
 
     def _categorize_field(self, field: FieldSummary) -> str:
-        field_type = field.type
-        name_lower = field.name.lower()
-
-        if field.is_primary or field_type in {"singleLineText", "multilineText"}:
-            return "Core Fields"
-        if field_type in self.RELATIONSHIP_FIELD_TYPES or field.linked_table_name:
-            return "Relationship Fields"
-        if field_type in self.ASSIGNMENT_FIELD_TYPES or any(
-            keyword in name_lower for keyword in self.ASSIGNMENT_KEYWORDS
-        ):
-            return "Assignment Fields"
-        if field_type in self.STATUS_FIELD_TYPES or any(
-            keyword in name_lower for keyword in self.STATUS_KEYWORDS
-        ):
-            return "Status Management"
-        if field_type in self.RATING_FIELD_TYPES or "rating" in name_lower:
-            return "Rating Fields"
-        if field_type in {"formula", "lookup", "rollup"}:
-            return "Calculated Fields"
-        if field_type in self.METADATA_FIELD_TYPES or any(
-            keyword in name_lower for keyword in self.METADATA_KEYWORDS
-        ):
-            return "Metadata Fields"
-        return "Other Fields"
+        return _categorize(
+            field.type,
+            field.name.lower(),
+            field.is_primary,
+            bool(field.linked_table_name),
+        )
 
     def _inline_configuration_highlights(self, field: FieldSummary) -> List[str]:
         config = field.configuration or {}
@@ -694,25 +748,22 @@ class ReportBuilder:
         if field.is_primary:
             highlights.append("primary")
 
-        if field_type in {"number", "currency", "percent"}:
+        if field_type in _NUMERIC_FIELD_TYPES:
             precision = config.get("precision")
-            if isinstance(precision, (int, float)):
+            if isinstance(precision, _NUMBER_TYPES):
                 highlights.append(f"precision {precision}")
             symbol = config.get("symbol")
             if isinstance(symbol, str):
                 highlights.append(f"symbol '{symbol}'")
-
-        if field_type == "checkbox":
+        elif field_type == "checkbox":
             color = config.get("color")
             if isinstance(color, str):
                 highlights.append(f"color {color}")
-
-        if field_type == "rating":
+        elif field_type == "rating":
             max_value = config.get("max")
-            if isinstance(max_value, (int, float)):
+            if isinstance(max_value, _NUMBER_TYPES):
                 highlights.append(f"max {max_value}")
-
-        if field_type in {"date", "dateTime"}:
+        elif field_type in _DATE_FIELD_TYPES:
             format_str = config.get("format")
             if isinstance(format_str, dict):
                 name = format_str.get("name") or format_str.get("format")
@@ -751,11 +802,11 @@ class ReportBuilder:
             relationship_field_id = config.get("recordLinkFieldId")
             linked_table_id = config.get("linkedTableId")
 
+        source_table: Optional[str] = None
         if lookup_field_id in field_lookup:
-            table_name, field_name = field_lookup[lookup_field_id]
-            source_desc = f"{table_name} -> {field_name}"
+            source_table, source_field = field_lookup[lookup_field_id]
         else:
-            source_desc = f"field {lookup_field_id}" if lookup_field_id else "linked records"
+            source_field = f"field {lookup_field_id}" if lookup_field_id else "linked records"
 
         if relationship_field_id in field_lookup:
             _, relation_field_name = field_lookup[relationship_field_id]
@@ -764,9 +815,9 @@ class ReportBuilder:
             relation_desc = "via linked records"
 
         if linked_table_id and linked_table_id in table_lookup:
-            target_table = table_lookup[linked_table_id]
-            source_desc = f"{target_table} -> {source_desc.split('->')[-1].strip()}"
+            source_table = table_lookup[linked_table_id]
 
+        source_desc = f"{source_table} -> {source_field}" if source_table else source_field
         return f"Pulls values from {source_desc} {relation_desc}".strip()
 
     def _describe_rollup(
@@ -776,24 +827,24 @@ class ReportBuilder:
         field_lookup: Dict[str, Tuple[str, str]],
         table_lookup: Dict[str, str],
     ) -> str:
-        rollup_config: Dict[str, object]
-        if isinstance(config.get("rollup"), dict):
-            rollup_config = config["rollup"]  # type: ignore[assignment]
-        else:
+        rollup_config = config.get("rollup")
+        if not isinstance(rollup_config, dict):
             rollup_config = config
 
-        aggregation = rollup_config.get("aggregation")
-        agg_display = aggregation.replace("_", " ") if isinstance(aggregation, str) else "aggregation"
+        try:
+            agg_display = rollup_config["aggregation"].replace("_", " ")
+        except (KeyError, AttributeError):
+            agg_display = "aggregation"
 
         field_id = rollup_config.get("fieldId")
         relation_field_id = rollup_config.get("recordLinkFieldId")
         linked_table_id = rollup_config.get("linkedTableId")
 
+        target_table: Optional[str] = None
         if field_id in field_lookup:
-            table_name, field_name = field_lookup[field_id]  # type: ignore[index]
-            target_desc = f"{table_name} -> {field_name}"
+            target_table, target_field = field_lookup[field_id]  # type: ignore[index]
         else:
-            target_desc = f"field {field_id}" if field_id else "the linked table"
+            target_field = f"field {field_id}" if field_id else "the linked table"
 
         if relation_field_id in field_lookup:
             _, relation_name = field_lookup[relation_field_id]  # type: ignore[index]
@@ -802,8 +853,9 @@ class ReportBuilder:
             relation_desc = "via linked records"
 
         if linked_table_id and linked_table_id in table_lookup:
-            table_name = table_lookup[linked_table_id]
-            target_desc = f"{table_name} -> {target_desc.split('->')[-1].strip()}"
+            target_table = table_lookup[linked_table_id]
+
+        target_desc = f"{target_table} -> {target_field}" if target_table else target_field
 
         return f"Rolls up {target_desc} using {agg_display} {relation_desc}".strip()
 
@@ -835,15 +887,14 @@ class ReportBuilder:
     def _format_view_sort(self, sorts: Optional[Sequence[Dict[str, object]]]) -> str:
         if not sorts:
             return ""
-        segments: List[str] = []
-        for sort in sorts:
-            if not isinstance(sort, dict):
-                continue
-            field_id = sort.get("fieldId") or sort.get("field")
-            direction = sort.get("direction", "asc")
-            if field_id:
-                segments.append(f"{field_id} {direction}")
-        return ", ".join(segments)
+        return ", ".join(
+            [
+                f"{field_id} {sort.get('direction', 'asc')}"
+                for sort in sorts
+                if isinstance(sort, dict)
+                and (field_id := sort.get("fieldId") or sort.get("field"))
+            ]
+        )
 
     def _summarize_filter(self, filters: Dict[str, object]) -> str:
         if not isinstance(filters, dict):
@@ -858,42 +909,27 @@ class ReportBuilder:
     def _extract_tasks(self, description: str) -> List[str]:
         if not description:
             return []
-        fragments = [frag.strip() for frag in re.split(r"[.;]", description) if frag.strip()]
-        tasks = [frag[0].upper() + frag[1:] if len(frag) > 1 else frag for frag in fragments]
-        return [task for task in tasks if len(task.split()) > 2]
+        tasks: List[str] = []
+        for fragment in _TASK_SPLIT_RE.split(description):
+            fragment = fragment.strip()
+            # Fewer than three words reads as a label rather than a task.
+            if len(fragment.split(maxsplit=2)) > 2:
+                tasks.append(fragment[0].upper() + fragment[1:])
+        return tasks
 
     def _humanize_relationship_type(self, rel_type: str) -> str:
-        clean = rel_type.replace("_", " ")
-        return clean.lower()
+        return _humanize_relationship_type(rel_type)
 
     def _humanize_field_type(self, field_type: str) -> str:
-        spaced = re.sub(r"(?<!^)(?=[A-Z])", " ", field_type)
-        spaced = spaced.replace("_", " ")
-        return spaced.lower()
+        return _humanize_field_type(field_type)
 
     def _describe_formula(self, formula: str) -> str:
-        uppercase = formula.upper()
-        descriptors: List[str] = []
-        if "IF(" in uppercase or "SWITCH(" in uppercase:
-            descriptors.append("Evaluates conditions to choose outputs")
-        if any(keyword in uppercase for keyword in ("SUM(", "AVERAGE(", "COUNT(", "MIN(", "MAX(")):
-            descriptors.append("Aggregates numeric values")
-        if any(keyword in uppercase for keyword in ("DATETIME", "DATE", "NOW(", "TODAY(")):
-            descriptors.append("Works with dates or times")
-        if any(keyword in uppercase for keyword in ("FIND(", "SEARCH(", "REGEX")):
-            descriptors.append("Checks text content")
+        mask = 0
+        for keyword in _FORMULA_TOKEN_RE.findall(formula.upper()):
+            mask |= _FORMULA_KEYWORD_BITS[keyword]
         if "+" in formula or "&" in formula:
-            descriptors.append("Combines multiple fields")
-        if not descriptors:
-            return "Derives a calculated value from the referenced fields"
-        return "; ".join(descriptors)
+            mask |= _FORMULA_COMBINES_BIT
+        return _FORMULA_DESCRIPTIONS[mask]
 
     def _extract_referenced_fields(self, formula: str) -> List[str]:
-        matches = re.findall(r"\{([^}]+)\}", formula)
-        seen = set()
-        ordered: List[str] = []
-        for match in matches:
-            if match not in seen:
-                seen.add(match)
-                ordered.append(match)
-        return ordered
+        return list(dict.fromkeys(_FIELD_REF_RE.findall(formula)))
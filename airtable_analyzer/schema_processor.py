@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import defaultdict, deque
+import sys
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .models import (
     AirtableBaseSchema,
     AirtableTable,
+    AirtableView,
     FieldSummary,
     RelationshipSummary,
     SchemaAnalysis,
@@ -18,6 +20,15 @@ from .models import (
 
 LOGGER = logging.getLogger(__name__)
 
+_LINKED_TABLE_KEYS = ("linkedTableId", "foreignTableId", "recordLinkTableId")
+_NESTED_LINK_KEYS = ("rollup", "lookup")
+_RELATIONSHIP_TYPES: Dict[str, str] = {
+    "linkedRecord": "linked_record",
+    "multipleRecordLinks": "linked_record",
+    "rollup": "rollup",
+    "lookup": "lookup",
+}
+
 
 class SchemaProcessor:
     """Process Airtable schemas into analysis artifacts."""
@@ -35,20 +46,28 @@ class SchemaProcessor:
         Returns:
             SchemaAnalysis containing normalized metadata for downstream components.
         """
-        table_lookup = {table.id: table.name for table in schema.tables}
+        # Table ids key every graph map below; interning lets lookups match by identity.
+        table_lookup = {sys.intern(table.id): table.name for table in schema.tables}
         table_summaries: List[TableSummary] = []
         relationships: List[RelationshipSummary] = []
-        dependency_graph: Dict[str, Set[str]] = defaultdict(set)
+        # Dependency edges are folded straight into the topological-sort inputs.
+        indegree: Dict[str, int] = dict.fromkeys(table_lookup, 0)
+        dependents: Dict[str, List[str]] = {}
 
         for table in schema.tables:
+            table_id = sys.intern(table.id)
             field_summaries, field_relationships, dependencies = self._process_fields(
                 table, table_lookup
             )
             relationships.extend(field_relationships)
-            dependency_graph[table.id].update(dependencies)
+            for dependency in dependencies:
+                indegree.setdefault(dependency, 0)
+                dependents.setdefault(dependency, []).append(table_id)
+            indegree[table_id] += len(dependencies)
 
             view_summaries = [self._process_view(view) for view in table.views]
-            table_summary = TableSummary(
+            # Summaries are built from an already-validated schema, so skip revalidation.
+            table_summary = TableSummary.model_construct(
                 id=table.id,
                 name=table.name,
                 description=table.description,
@@ -59,9 +78,7 @@ class SchemaProcessor:
             )
             table_summaries.append(table_summary)
 
-        creation_order = self._derive_creation_order(
-            dependency_graph, table_lookup, schema.tables
-        )
+        creation_order = self._derive_creation_order(indegree, dependents, table_lookup)
 
         return SchemaAnalysis(
             base_id=schema.id,
@@ -81,9 +98,13 @@ class SchemaProcessor:
         for field in table.fields:
             configuration = self._normalize_configuration(field.options or {})
             linked_table_id = self._extract_linked_table_id(configuration)
-            linked_table_name = table_lookup.get(linked_table_id)
+            if linked_table_id:
+                linked_table_id = sys.intern(linked_table_id)
+                linked_table_name = table_lookup.get(linked_table_id)
+            else:
+                linked_table_name = None
 
-            field_summary = FieldSummary(
+            field_summary = FieldSummary.model_construct(
                 id=field.id,
                 name=field.name,
                 type=field.type,
@@ -98,7 +119,7 @@ class SchemaProcessor:
             if linked_table_id and linked_table_id != table.id:
                 dependencies.add(linked_table_id)
                 relationships.append(
-                    RelationshipSummary(
+                    RelationshipSummary.model_construct(
                         from_table_id=table.id,
                         from_table_name=table.name,
                         from_field_id=field.id,
@@ -112,9 +133,9 @@ class SchemaProcessor:
 
         return field_summaries, relationships, dependencies
 
-    def _process_view(self, view: Any) -> ViewSummary:
+    def _process_view(self, view: AirtableView) -> ViewSummary:
         visible_fields = self._extract_visible_fields(view)
-        return ViewSummary(
+        return ViewSummary.model_construct(
             id=view.id,
             name=view.name,
             type=view.type,
@@ -125,94 +146,158 @@ class SchemaProcessor:
             groups=view.groups,
         )
 
-    def _extract_visible_fields(self, view: Any) -> List[str]:
-        order = getattr(view, "field_order", None)
-        if isinstance(order, dict):
+    def _extract_visible_fields(self, view: AirtableView) -> List[str]:
+        order = view.field_order
+        if order:
             field_ids = order.get("fieldIds")
             if isinstance(field_ids, list):
                 return [field_id for field_id in field_ids if isinstance(field_id, str)]
         return []
 
     def _normalize_configuration(self, options: Dict[str, Any]) -> Dict[str, Any]:
-        sanitized: Dict[str, Any] = {}
-        for key, value in options.items():
-            if value is None:
-                continue
-            if isinstance(value, list):
-                sanitized[key] = value
-            elif isinstance(value, dict):
-                sanitized[key] = value
-            else:
-                sanitized[key] = value
-        return sanitized
+        return {key: value for key, value in options.items() if value is not None}
 
     def _extract_linked_table_id(self, configuration: Dict[str, Any]) -> Optional[str]:
-        candidates = [
-            configuration.get("linkedTableId"),
-            configuration.get("foreignTableId"),
-            configuration.get("recordLinkTableId"),
-        ]
-        for candidate in candidates:
+        for key in _LINKED_TABLE_KEYS:
+            candidate = configuration.get(key)
             if isinstance(candidate, str):
                 return candidate
-        rollup = configuration.get("rollup")
-        if isinstance(rollup, dict):
-            linked = rollup.get("linkedTableId")
-            if isinstance(linked, str):
-                return linked
-        lookup = configuration.get("lookup")
-        if isinstance(lookup, dict):
-            linked = lookup.get("linkedTableId")
-            if isinstance(linked, str):
-                return linked
+        for key in _NESTED_LINK_KEYS:
+            nested = configuration.get(key)
+            if isinstance(nested, dict):
+                linked = nested.get("linkedTableId")
+                if isinstance(linked, str):
+                    return linked
         return None
 
     def _determine_relationship_type(self, field_type: str) -> str:
-        relational_types = {
-            "linkedRecord": "linked_record",
-            "multipleRecordLinks": "linked_record",
-            "rollup": "rollup",
-            "lookup": "lookup",
-        }
-        return relational_types.get(field_type, field_type)
+        return _RELATIONSHIP_TYPES.get(field_type, field_type)
 
     def _derive_creation_order(
         self,
-        graph: Dict[str, Set[str]],
+        indegree: Dict[str, int],
+        dependents: Dict[str, List[str]],
         table_lookup: Dict[str, str],
-        tables: Iterable[AirtableTable],
     ) -> List[str]:
-        indegree: Dict[str, int] = {}
-        adjacency: Dict[str, Set[str]] = defaultdict(set)
-
-        for table in tables:
-            table_id = table.id
-            indegree.setdefault(table_id, 0)
-            adjacency.setdefault(table_id, set())
+        if not dependents:
+            return sorted(table_lookup.get(table_id, table_id) for table_id in indegree)
 
-        for table_id, dependencies in graph.items():
-            for dependency in dependencies:
-                if dependency not in indegree:
-                    indegree[dependency] = 0
-                adjacency[dependency].add(table_id)
-                indegree[table_id] = indegree.get(table_id, 0) + 1
-
-        queue: Deque[str] = deque(sorted([t for t, deg in indegree.items() if deg == 0]))
+        # Ready tables come off a min-heap by name, so ties resolve alphabetically.
+        ready = [
+            (table_lookup.get(table_id, table_id), table_id)
+            for table_id, degree in indegree.items()
+            if degree == 0
+        ]
+        heapq.heapify(ready)
         ordered: List[str] = []
 
-        while queue:
-            current = queue.popleft()
-            ordered.append(table_lookup.get(current, current))
-            for neighbor in sorted(adjacency[current]):
+        while ready:
+            name, current = heapq.heappop(ready)
+            ordered.append(name)
+            for neighbor in dependents.get(current, ()):
                 indegree[neighbor] -= 1
                 if indegree[neighbor] == 0:
-                    queue.append(neighbor)
+                    heapq.heappush(ready, (table_lookup.get(neighbor, neighbor), neighbor))
 
         if len(ordered) != len(indegree):
-            # Cycles detected; fall back to alphabetical order.
             self.logger.warning(
-                "Cyclic dependencies detected in Airtable schema. Using fallback order."
+                "Cyclic dependencies detected in Airtable schema. "
+                "Grouping mutually linked tables together."
             )
-            return [table_lookup.get(table.id, table.id) for table in sorted(tables, key=lambda t: t.name)]
+            return self._derive_cyclic_creation_order(list(indegree), dependents, table_lookup)
+
+        return ordered
+
+    def _derive_cyclic_creation_order(
+        self,
+        table_ids: List[str],
+        dependents: Dict[str, List[str]],
+        table_lookup: Dict[str, str],
+    ) -> List[str]:
+        """Order tables by dependency, emitting each cycle as one alphabetical group."""
+        components = _strongly_connected_components(table_ids, dependents)
+        component_of = {
+            member: index for index, members in enumerate(components) for member in members
+        }
+        component_names = [
+            sorted(table_lookup.get(member, member) for member in members)
+            for members in components
+        ]
+
+        component_indegree = [0] * len(components)
+        component_dependents: List[Set[int]] = [set() for _ in components]
+        for source, targets in dependents.items():
+            source_component = component_of[source]
+            for target in targets:
+                target_component = component_of[target]
+                if (
+                    target_component != source_component
+                    and target_component not in component_dependents[source_component]
+                ):
+                    component_dependents[source_component].add(target_component)
+                    component_indegree[target_component] += 1
+
+        ready = [
+            (names[0], index)
+            for index, names in enumerate(component_names)
+            if component_indegree[index] == 0
+        ]
+        heapq.heapify(ready)
+        ordered: List[str] = []
+
+        while ready:
+            _, current = heapq.heappop(ready)
+            ordered.extend(component_names[current])
+            for neighbor in component_dependents[current]:
+                component_indegree[neighbor] -= 1
+                if component_indegree[neighbor] == 0:
+                    heapq.heappush(ready, (component_names[neighbor][0], neighbor))
 
         return ordered
+
+
+def _strongly_connected_components(
+    nodes: Iterable[str], edges: Dict[str, List[str]]
+) -> List[List[str]]:
+    """Return the strongly connected components of a graph (iterative Tarjan)."""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(edges.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
@@ -17,6 +17,19 @@ from .schema_processor import SchemaProcessor
 LOGGER = logging.getLogger(__name__)
 
 
+class _SafeFilenameTable(dict):
+    """``str.translate`` table mapping non-alphanumeric characters to ``_``."""
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char in "-_" else ord("_")
+        self[codepoint] = mapped
+        return mapped
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
 class AirtableAnalysisService:
     """Coordinate data retrieval, analysis, and report generation."""
 
@@ -75,7 +88,7 @@ class AirtableAnalysisService:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         # Sanitize base_name for use in filename
-        safe_base_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in base_name)
+        safe_base_name = base_name.translate(_SAFE_FILENAME_TABLE)
         filename = f"{safe_base_name}_{timestamp}.md"
         return Path("reports") / filename
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -11,20 +12,26 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from airtable_analyzer.airtable_client import AirtableClient  # noqa: E402
+from airtable_analyzer.config import Settings  # noqa: E402
+from airtable_analyzer.gemini_client import GeminiClient  # noqa: E402
 from airtable_analyzer.models import (  # noqa: E402
     AirtableBaseSchema,
     DuplicationGuide,
     DuplicationStep,
     DuplicationTableDetail,
 )
-from airtable_analyzer.schema_processor import SchemaProcessor
+from airtable_analyzer.report_builder import ReportBuilder  # noqa: E402
+from airtable_analyzer.schema_processor import SchemaProcessor  # noqa: E402
 
+SAMPLE_BASE_ID = "appSample"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_schema_payload() -> dict:
     """Return a representative Airtable schema payload."""
     return {
-        "id": "appSample",
+        "id": SAMPLE_BASE_ID,
         "name": "Sample Operations",
         "tables": [
             {
@@ -93,7 +100,7 @@ def sample_schema_payload() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_schema(sample_schema_payload: dict) -> AirtableBaseSchema:
     """Return a validated Airtable base schema."""
     return AirtableBaseSchema.model_validate(sample_schema_payload)
@@ -105,7 +112,7 @@ def sample_analysis(sample_schema: AirtableBaseSchema):
     return SchemaProcessor().analyze_schema(sample_schema)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_duplication_guide() -> DuplicationGuide:
     """Return a representative Gemini response."""
     return DuplicationGuide(
@@ -146,3 +153,42 @@ def sample_duplication_guide() -> DuplicationGuide:
             "Create sample project and task to validate relations."
         ],
     )
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Return settings pointing at the sample base."""
+    return Settings(
+        AIRTABLE_ACCESS_TOKEN="token",
+        AIRTABLE_BASE_ID=SAMPLE_BASE_ID,
+        GEMINI_API_KEY="api-key",
+        GEMINI_MODEL="gemini-2.5-pro",
+    )
+
+
+@pytest.fixture(scope="session")
+def schema_processor() -> SchemaProcessor:
+    """Return a shared, stateless schema processor."""
+    return SchemaProcessor()
+
+
+@pytest.fixture(scope="session")
+def report_builder() -> ReportBuilder:
+    """Return a shared, stateless report builder."""
+    return ReportBuilder()
+
+
+@pytest.fixture
+def airtable_client(sample_schema: AirtableBaseSchema) -> MagicMock:
+    """Return an Airtable client mock serving the sample schema."""
+    client = MagicMock(spec=AirtableClient)
+    client.fetch_base_schema.return_value = sample_schema
+    return client
+
+
+@pytest.fixture
+def gemini_client(sample_duplication_guide: DuplicationGuide) -> MagicMock:
+    """Return a Gemini client mock serving the sample guide."""
+    client = MagicMock(spec=GeminiClient)
+    client.generate_duplication_guide.return_value = sample_duplication_guide
+    return client
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
-from airtable_analyzer.airtable_client import AirtableClient
+from airtable_analyzer.airtable_client import AirtableClient, RateLimiter
 from airtable_analyzer.exceptions import (
     AirtableAuthenticationError,
     AirtableRateLimitError,
@@ -15,15 +16,19 @@ from airtable_analyzer.exceptions import (
 
 
 class FakeResponse:
-    """Simple stand-in for requests.Response."""
+    """Simple stand-in for httpx.Response."""
 
-    def __init__(self, payload: Dict[str, Any], status_code: int = 200) -> None:
+    def __init__(
+        self,
+        payload: Dict[str, Any],
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
         self._payload = payload
         self.status_code = status_code
+        self.headers = headers or {}
         self.text = json.dumps(payload)
-
-    def json(self) -> Dict[str, Any]:
-        return self._payload
+        self.content = self.text.encode("utf-8")
 
 
 class FakeSession:
@@ -34,14 +39,13 @@ class FakeSession:
         self.headers: Dict[str, str] = {}
         self.requests: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
 
-    def request(
+    def get(
         self,
-        method: str,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> FakeResponse:
-        self.requests.append((method, url, params))
+        self.requests.append(("GET", url, params))
         if not self.responses:
             raise AssertionError("No more fake responses configured.")
         return self.responses.pop(0)
@@ -110,6 +114,66 @@ def test_fetch_base_schema_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert schema.name == "Demo Base"
     assert len(schema.tables) == 2
     assert schema.tables[0].fields[1].options == {"linkedTableId": "tblTasks"}
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_fetch_base_schema_uses_inline_views() -> None:
+    session = FakeSession(
+        [
+            FakeResponse({"base": {"id": "app123", "name": "Demo Base"}}),
+            FakeResponse(
+                {
+                    "tables": [
+                        {
+                            "id": "tblProjects",
+                            "name": "Projects",
+                            "fields": [
+                                {
+                                    "id": "fldProjectName",
+                                    "name": "Project Name",
+                                    "type": "singleLineText",
+                                }
+                            ],
+                            "views": [{"id": "viwGrid", "name": "Grid", "type": "grid"}],
+                        }
+                    ]
+                }
+            ),
+        ]
+    )
+    client = AirtableClient(
+        access_token="token",
+        timeout_seconds=5,
+        max_retries=1,
+        initial_backoff_seconds=0.01,
+        session=session,
+    )
+    client.rate_limiter.acquire = lambda: None  # type: ignore[assignment]
+
+    schema = client.fetch_base_schema("app123")
+
+    assert schema.tables[0].views[0].name == "Grid"
+    assert len(session.requests) == 2
+
+
+def test_fetch_base_schema_reuses_cached_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _build_happy_path_session()
+    client = AirtableClient(
+        access_token="token",
+        timeout_seconds=5,
+        max_retries=2,
+        initial_backoff_seconds=0.01,
+        session=session,
+    )
+    client.rate_limiter.acquire = lambda: None  # type: ignore[assignment]
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+    first = client.fetch_base_schema("app123")
+    request_count = len(session.requests)
+    second = client.fetch_base_schema("app123")
+
+    assert second is first
+    assert len(session.requests) == request_count
 
 
 def test_fetch_base_schema_auth_failure() -> None:
@@ -141,3 +205,48 @@ def test_fetch_base_schema_rate_limit_exhausted(monkeypatch: pytest.MonkeyPatch)
 
     with pytest.raises(AirtableRateLimitError):
         client.fetch_base_schema("app123")
+
+
+def test_rate_limit_honors_retry_after() -> None:
+    session = FakeSession(
+        [
+            FakeResponse({}, status_code=429, headers={"Retry-After": "3"}),
+            FakeResponse({"base": {"id": "app123", "name": "Demo Base"}}),
+            FakeResponse({"tables": []}),
+        ]
+    )
+    client = AirtableClient(
+        access_token="token",
+        timeout_seconds=5,
+        max_retries=2,
+        initial_backoff_seconds=0.0,
+        session=session,
+    )
+    client.rate_limiter.acquire = lambda: None  # type: ignore[assignment]
+    penalties: List[float] = []
+    client.rate_limiter.penalize = penalties.append  # type: ignore[assignment]
+
+    schema = client.fetch_base_schema("app123")
+
+    assert schema.name == "Demo Base"
+    assert penalties == [3.0]
+
+
+def test_rate_limiter_allows_concurrent_callers_within_budget() -> None:
+    limiter = RateLimiter(max_calls=4, period_seconds=60.0)
+    workers = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=1.0)
+
+    assert not any(worker.is_alive() for worker in workers)
+    assert limiter.tokens < 1.0
+
+
+def test_rate_limiter_penalize_drains_tokens() -> None:
+    limiter = RateLimiter(max_calls=5, period_seconds=1.0)
+
+    limiter.penalize(2.0)
+
+    assert limiter.tokens <= 1.0 - 2.0 * limiter.rate
@@ -45,3 +45,44 @@ def test_generate_duplication_guide_invalid_json(
 
     with pytest.raises(GeminiClientError):
         client.generate_duplication_guide(sample_analysis)
+
+
+def test_prompt_payload_includes_table_structure(
+    monkeypatch: pytest.MonkeyPatch,
+    sample_analysis: SchemaAnalysis,
+) -> None:
+    monkeypatch.setattr("google.generativeai.configure", lambda **_: None)
+    monkeypatch.setattr("google.generativeai.GenerativeModel", lambda **_: Mock())
+
+    client = GeminiClient(api_key="token", model_name="gemini-2.5-pro")
+    payload = client._build_prompt_payload(sample_analysis)
+
+    tasks = payload["base"]["tables"][1]
+    assert tasks["dependencies"] == ["tblProjects"]
+    assert tasks["fields"][1]["linked_table_name"] == "Projects"
+    assert set(tasks["views"][0]) == {
+        "id",
+        "name",
+        "type",
+        "description",
+        "visible_fields",
+        "filters",
+        "sorts",
+        "groups",
+    }
+    assert payload["base"]["relationships"][0]["from_table"] == "Tasks"
+
+
+def test_extract_text_uses_first_candidate_part(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("google.generativeai.configure", lambda **_: None)
+    monkeypatch.setattr("google.generativeai.GenerativeModel", lambda **_: Mock())
+    part = SimpleNamespace(text='{"base_overview": "x"}')
+    response = SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))]
+    )
+
+    client = GeminiClient(api_key="token", model_name="gemini-2.5-pro")
+
+    assert client._extract_text(response) is part.text
@@ -22,3 +22,59 @@ def test_schema_processor_field_metadata(sample_schema: AirtableBaseSchema) -> N
     field = next(field for field in projects_table.fields if field.name == "Stage")
     assert field.configuration["choices"][0]["name"] == "Idea"
     assert not field.is_primary
+
+
+def _linked_table(table_id: str, name: str, links_to: str = "") -> dict:
+    fields = [{"id": f"fld{name}", "name": "Name", "type": "singleLineText"}]
+    if links_to:
+        fields.append(
+            {
+                "id": f"fld{name}Link",
+                "name": "Link",
+                "type": "multipleRecordLinks",
+                "options": {"linkedTableId": links_to},
+            }
+        )
+    return {"id": table_id, "name": name, "fields": fields, "views": []}
+
+
+def test_schema_processor_orders_ready_tables_by_name() -> None:
+    schema = AirtableBaseSchema.model_validate(
+        {
+            "id": "appOrder",
+            "name": "Ordering",
+            "tables": [
+                _linked_table("tbl1", "Zebras"),
+                _linked_table("tbl2", "Apples"),
+                _linked_table("tbl3", "Bananas", links_to="tbl1"),
+            ],
+        }
+    )
+
+    analysis = SchemaProcessor().analyze_schema(schema)
+
+    assert analysis.suggested_table_creation_order == ["Apples", "Zebras", "Bananas"]
+
+
+def test_schema_processor_groups_cyclic_tables() -> None:
+    schema = AirtableBaseSchema.model_validate(
+        {
+            "id": "appCycle",
+            "name": "Cycle",
+            "tables": [
+                _linked_table("tbl1", "Apples", links_to="tbl4"),
+                _linked_table("tbl2", "Bananas", links_to="tbl3"),
+                _linked_table("tbl3", "Cherries", links_to="tbl2"),
+                _linked_table("tbl4", "Zebras"),
+            ],
+        }
+    )
+
+    analysis = SchemaProcessor().analyze_schema(schema)
+
+    assert analysis.suggested_table_creation_order == [
+        "Bananas",
+        "Cherries",
+        "Zebras",
+        "Apples",
+    ]